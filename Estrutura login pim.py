@@ -23,8 +23,7 @@ def saveAccounts(accounts):
     except IOError:
         print(f"Erro ao escrever no arquivo '{ACCOUNTS_FILE}'.")
 
-def userFileExists(username):
-    accounts = loadAccounts()
+def userFileExists(username, accounts):
     for account in accounts:
         if account.get("username") == username:
             return True
@@ -57,11 +56,11 @@ def listAccounts():
 def addAccount():
     print("\n--- Adicionar Nova Conta ---")
     username = input("Digite o novo nome de usuário: ")
-    if userFileExists(username):
+    accounts = loadAccounts()
+    if userFileExists(username, accounts):
         print("Este nome de usuário já existe. Escolha outro.")
         return
     password = input("Digite a senha para o novo usuário: ")
-    accounts = loadAccounts()
     accounts.append({"username": username, "password": password})
     saveAccounts(accounts)
     print(f"Conta para o usuário '{username}' criada com sucesso.")